@@ -1,11 +1,23 @@
 import streamlit as st
 import json
-import time
+import logging
 import os
-from datetime import datetime, timedelta
-from urllib.parse import urlparse, parse_qs
+import sqlite3
+from collections import Counter
+from contextlib import closing, contextmanager
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+from urllib.parse import parse_qs
 from pathlib import Path
 import re
+from itertools import islice
+from streamlit_autorefresh import st_autorefresh
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -14,393 +26,728 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize session state
-if 'slides' not in st.session_state:
-    st.session_state.slides = []
-if 'edit_slide_id' not in st.session_state:
+# Initialize session state once per session
+if 'initialized' not in st.session_state:
+    st.session_state.slides = {}
     st.session_state.edit_slide_id = None
-if 'delete_slide_id' not in st.session_state:
     st.session_state.delete_slide_id = None
-if 'auto_refresh' not in st.session_state:
     st.session_state.auto_refresh = False
-if 'refresh_interval' not in st.session_state:
     st.session_state.refresh_interval = 10
-if 'last_refresh' not in st.session_state:
     st.session_state.last_refresh = datetime.now()
-if 'file_last_modified' not in st.session_state:
-    st.session_state.file_last_modified = 0
-if 'last_checked' not in st.session_state:
+    st.session_state.file_last_modified = None
     st.session_state.last_checked = datetime.now()
-if 'form_submitted' not in st.session_state:
     st.session_state.form_submitted = False
-if 'upload_form_data' not in st.session_state:
+    st.session_state.auto_embed = False
+    st.session_state.dirty_slides = {}
+    st.session_state.slide_stats = None
+    st.session_state.page = 0
     st.session_state.upload_form_data = {
         'url': '',
         'title': '',
         'description': '',
         'uploader': ''
     }
+    st.session_state.initialized = True
+
+logger = logging.getLogger(__name__)
 
-# Create data directory
+# Data files (the directory is created by init_db)
 DATA_DIR = Path("data")
-DATA_DIR.mkdir(exist_ok=True)
-DB_FILE = DATA_DIR / "slides.json"
+DB_FILE = DATA_DIR / "slides.db"
+LEGACY_JSON_FILE = DATA_DIR / "slides.json"
+
+# Slides table layout
+SLIDE_COLUMNS = (
+    'id', 'title', 'url', 'presentation_id', 'type',
+    'uploader', 'date', 'description', 'last_modified',
+    'embed_url', 'embed_code'
+)
+# AUTOINCREMENT keeps SQLite from reusing the id of the newest deleted slide
+CREATE_SLIDES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT,
+        url TEXT,
+        presentation_id TEXT,
+        type TEXT,
+        uploader TEXT,
+        date TEXT,
+        description TEXT,
+        last_modified TEXT,
+        embed_url TEXT,
+        embed_code TEXT
+    )
+"""
+INSERT_SLIDE_SQL = (
+    f"INSERT INTO slides ({', '.join(SLIDE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in SLIDE_COLUMNS)})"
+)
+
+# PRAGMA user_version once data/slides.json has been imported
+LEGACY_IMPORTED_VERSION = 1
+
+# Precompiled URL patterns
+SLIDES_ID_RE = re.compile(r'/d/([a-zA-Z0-9_-]+)')
+SLIDESHARE_RE = re.compile(r'slideshare\.net/.*/([^/?]+)')
+
+# Domains whose presentations can be embedded (tuple for str.endswith)
+EMBEDDABLE_PLATFORMS = (
+    'canva.com', 'slideshare.net', 'speakerdeck.com',
+    'visme.co', 'prezi.com', 'haikudeck.com', 'slideonline.com'
+)
+
+# Number of slides rendered per dashboard page
+PAGE_SIZE = 10
+
+# Per-slide actions; the first entry is the idle selection
+SLIDE_ACTIONS = ("👁️ View", "✏️ Edit", "🔄 Update", "🗑️ Delete")
+
+# HTML templates, filled with str.format at render time
+SLIDE_HEADER_TEMPLATE = """
+<div style="
+    background: #ffffff;
+    border-radius: 8px 8px 0 0;
+    padding: 20px;
+    margin: 15px 0 0 0;
+    border: 1px solid #e0e0e0;
+    border-bottom: none;
+">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <h3 style="margin: 0 0 8px 0; color: #2c3e50; font-size: 1.4rem; font-weight: 600;">
+                📊 {title}
+            </h3>
+            <div style="display: flex; align-items: center; gap: 15px; color: #666; font-size: 0.9em;">
+                <span style="display: flex; align-items: center; gap: 5px;">
+                    👤 {uploader}
+                </span>
+                <span>•</span>
+                <span>{date}</span>
+                <span>•</span>
+                <span title="Last modified" style="color: #888;">
+                    📝 {last_modified}
+                </span>
+            </div>
+        </div>
+        <div style="
+            background: {badge_background};
+            color: {badge_color};
+            padding: 6px 12px;
+            border-radius: 15px;
+            font-size: 0.9em;
+            font-weight: 500;
+        ">
+            {badge_label}
+        </div>
+    </div>
+</div>
+"""
 
+SLIDE_DESCRIPTION_TEMPLATE = """
+<div style="
+    background: #f8f9fa;
+    padding: 15px 20px;
+    border-left: 3px solid #1a73e8;
+    margin: 0;
+    border-right: 1px solid #e0e0e0;
+    border-bottom: 1px solid #e0e0e0;
+">
+    <p style="margin: 0; color: #555; font-size: 1em; line-height: 1.5;">{description}</p>
+</div>
+"""
+
+SLIDE_BODY_OPEN_HTML = """
+<div style="
+    background: #ffffff;
+    padding: 0;
+    border: 1px solid #e0e0e0;
+    border-top: none;
+    border-radius: 0 0 8px 8px;
+">
+"""
+
+GOOGLE_IFRAME_TEMPLATE = """
+<iframe 
+    src="{embed_url}" 
+    width="100%" 
+    height="450" 
+    frameborder="0" 
+    loading="lazy"
+    allowfullscreen="true" 
+    mozallowfullscreen="true" 
+    webkitallowfullscreen="true"
+    style="border-radius: 0;">
+</iframe>
+"""
+
+WEB_IFRAME_TEMPLATE = """
+<iframe 
+    src="{src}" 
+    width="100%" 
+    height="500" 
+    frameborder="0" 
+    loading="lazy"
+    allowfullscreen
+    style="border-radius: 8px;">
+</iframe>
+"""
+
+SLIDESHARE_IFRAME_TEMPLATE = """
+<iframe 
+    src="https://www.slideshare.net/slideshow/embed_code/key/{slide_id}" 
+    width="100%" 
+    height="500" 
+    frameborder="0" 
+    loading="lazy"
+    marginwidth="0" 
+    marginheight="0" 
+    scrolling="no" 
+    allowfullscreen
+    style="border-radius: 8px;">
+</iframe>
+"""
+
+CLICK_TO_LOAD_TEMPLATE = """
+<template id="embed-template">{embed_html}</template>
+<div id="embed-facade" style="
+    height: 430px;
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+    background: #f8f9fa;
+    border: 1px solid #e0e0e0;
+    border-radius: 8px;
+    font-family: sans-serif;
+">
+    {preview_html}
+    <div style="color: #2c3e50; margin-bottom: 20px; font-size: 1.1em;">{title}</div>
+    <button onclick="
+        var facade = document.getElementById('embed-facade');
+        facade.replaceWith(document.getElementById('embed-template').content.cloneNode(true));
+    " style="
+        background: #1a73e8;
+        color: white;
+        border: none;
+        padding: 10px 25px;
+        border-radius: 4px;
+        font-size: 0.95em;
+        cursor: pointer;
+    ">
+        ▶ Load preview
+    </button>
+</div>
+"""
+
+FACADE_ICON_HTML = """<div style="font-size: 3rem; margin-bottom: 15px; color: #666;">📊</div>"""
+
+FACADE_THUMBNAIL_TEMPLATE = """<img
+    src="{thumbnail_url}"
+    alt=""
+    loading="lazy"
+    onerror="this.remove()"
+    style="max-height: 280px; max-width: 90%; margin-bottom: 15px; border-radius: 4px; box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);"
+>"""
+
+OPEN_LINK_TEMPLATE = """
+<div style="
+    padding: 15px;
+    background: #f8f9fa;
+    border-top: 1px solid #e0e0e0;
+    text-align: center;
+">
+    <a href="{url}" target="_blank" style="
+        text-decoration: none;
+        color: #1a73e8;
+        font-size: 0.95em;
+        padding: 8px 20px;
+        border: 1px solid #1a73e8;
+        border-radius: 4px;
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+        background: white;
+    ">
+        🔗 {label}
+    </a>
+</div>
+"""
+
+EXTERNAL_LINK_TEMPLATE = """
+<div style="
+    padding: 40px 20px;
+    background: #f8f9fa;
+    text-align: center;
+">
+    <div style="font-size: 3rem; margin-bottom: 15px; color: #666;">🔗</div>
+    <h4 style="color: #2c3e50; margin-bottom: 10px;">External Presentation</h4>
+    <p style="color: #666; margin-bottom: 20px; font-size: 0.95em;">
+        {url_preview}
+    </p>
+    <a href="{url}" target="_blank" style="
+        text-decoration: none;
+        background: #1a73e8;
+        color: white;
+        padding: 10px 25px;
+        border-radius: 4px;
+        font-weight: 500;
+        display: inline-block;
+    ">
+        Open Presentation
+    </a>
+</div>
+"""
+
+DELETE_CONFIRM_TEMPLATE = """
+<div style="
+    background: #fff8e1;
+    border: 1px solid #ffecb3;
+    border-radius: 8px;
+    padding: 25px;
+    text-align: center;
+    margin: 20px 0;
+">
+    <div style="font-size: 2.5rem; margin-bottom: 15px;">⚠️</div>
+    <h3 style="color: #ff6f00; margin-bottom: 15px;">
+        Delete "{title}"?
+    </h3>
+    <p style="color: #666;">
+        This action cannot be undone. The slide will be permanently removed.
+    </p>
+</div>
+"""
+
+PAGE_INDICATOR_TEMPLATE = """
+<div style="text-align: center; color: #666; padding-top: 8px;">
+    Page {page} of {total_pages}
+</div>
+"""
+
+REFRESH_STATUS_TEMPLATE = """
+<div style="text-align: right; margin-bottom: 10px;">
+    <span class="refresh-status">{refresh_status}</span>
+</div>
+"""
+
+@lru_cache(maxsize=1024)
 def extract_google_slides_id(url):
     """Extract Google Slides ID from various URL formats"""
-    try:
-        if "/d/" in url:
-            parts = url.split("/d/")[1].split("/")[0]
-            return parts
-        if "docs.google.com/presentation/d/" in url:
-            pattern = r'docs\.google\.com/presentation/d/([a-zA-Z0-9-_]+)'
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        if "drive.google.com" in url:
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query)
-            if 'id' in query_params:
-                return query_params['id'][0]
-        if "presentation/d/" in url:
-            pattern = r'presentation/d/([a-zA-Z0-9-_]+)'
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return url
-    except:
-        return url
+    # Cheap substring tests gate the regex and query parsing
+    if "/d/" in url:
+        match = SLIDES_ID_RE.search(url)
+        if match:
+            return match.group(1)
+    if "drive.google.com" in url:
+        query_params = parse_qs(url.partition('?')[2].partition('#')[0])
+        if 'id' in query_params:
+            return query_params['id'][0]
+    return url
+
+def get_domain(url):
+    """Return the lowercased host part of a URL without full URL parsing"""
+    _, _, rest = url.partition('://')
+    netloc = rest.partition('/')[0].partition('?')[0].partition('#')[0]
+    # Drop any "user@" prefix and ":port" suffix
+    return netloc.rpartition('@')[2].partition(':')[0].lower()
 
+@lru_cache(maxsize=1024)
 def is_embeddable_url(url):
     """Check if a web link can be embedded"""
-    embeddable_platforms = [
-        'canva.com', 'slideshare.net', 'speakerdeck.com', 
-        'visme.co', 'prezi.com', 'haikudeck.com', 'slideonline.com'
-    ]
-    parsed = urlparse(url)
-    domain = parsed.netloc.lower()
-    return any(platform in domain for platform in embeddable_platforms)
+    domain = get_domain(url)
+    return domain.endswith(EMBEDDABLE_PLATFORMS)
 
+@lru_cache(maxsize=1024)
 def get_embed_code(url):
     """Get embed code for various presentation platforms"""
-    parsed = urlparse(url)
-    domain = parsed.netloc.lower()
-    
-    if 'canva.com' in domain:
-        return f"""
-        <iframe 
-            src="{url}/embed" 
-            width="100%" 
-            height="500" 
-            frameborder="0" 
-            allowfullscreen
-            style="border-radius: 8px;">
-        </iframe>
-        """
+    domain = get_domain(url)
+    
+    if 'canva.com' in domain or 'speakerdeck.com' in domain:
+        return WEB_IFRAME_TEMPLATE.format(src=escape(f"{url}/embed", quote=True))
     elif 'slideshare.net' in domain:
-        match = re.search(r'slideshare\.net/.*/([^/?]+)', url)
+        match = SLIDESHARE_RE.search(url)
         if match:
-            slide_id = match.group(1)
-            return f"""
-            <iframe 
-                src="https://www.slideshare.net/slideshow/embed_code/key/{slide_id}" 
-                width="100%" 
-                height="500" 
-                frameborder="0" 
-                marginwidth="0" 
-                marginheight="0" 
-                scrolling="no" 
-                allowfullscreen
-                style="border-radius: 8px;">
-            </iframe>
-            """
-    elif 'speakerdeck.com' in domain:
-        return f"""
-        <iframe 
-            src="{url}/embed" 
-            width="100%" 
-            height="500" 
-            frameborder="0" 
-            allowfullscreen
-            style="border-radius: 8px;">
-        </iframe>
-        """
+            return SLIDESHARE_IFRAME_TEMPLATE.format(slide_id=escape(match.group(1), quote=True))
     
     return None
 
+def wrap_click_to_load(embed_html, title, thumbnail_url=None):
+    """Wrap embed HTML in a click-to-load placeholder unless auto-embed is enabled"""
+    if st.session_state.auto_embed:
+        return embed_html
+    
+    # The component iframe runs scripts, so user-supplied text must be escaped
+    if thumbnail_url:
+        preview_html = FACADE_THUMBNAIL_TEMPLATE.format(thumbnail_url=escape(thumbnail_url, quote=True))
+    else:
+        preview_html = FACADE_ICON_HTML
+    return CLICK_TO_LOAD_TEMPLATE.format(embed_html=embed_html, title=escape(title), preview_html=preview_html)
+
+@lru_cache(maxsize=1024)
 def extract_title_from_url(url):
     """Try to extract title from URL or use default"""
+    if "docs.google.com" in url or "drive.google.com" in url:
+        return "Google Slides Presentation"
+    else:
+        domain = get_domain(url).removeprefix("www.")
+        if 'canva.com' in domain:
+            return "Canva Presentation"
+        elif 'slideshare.net' in domain:
+            return "SlideShare Presentation"
+        elif 'speakerdeck.com' in domain:
+            return "SpeakerDeck Presentation"
+        elif not domain:
+            return "Untitled Presentation"
+        return f"Presentation from {domain}"
+
+def json_loads(data):
+    """Deserialize JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def connect_db():
+    """Open a connection to the slides database"""
+    conn = sqlite3.connect(DB_FILE)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def slide_to_row(slide):
+    """Convert a slide dict to a tuple ordered like SLIDE_COLUMNS"""
+    return tuple(slide.get(column) for column in SLIDE_COLUMNS)
+
+def legacy_slide_id(value):
+    """Return a legacy slide id as an int, or None to let SQLite assign one"""
+    if isinstance(value, bool):
+        return None
     try:
-        if "docs.google.com" in url or "drive.google.com" in url:
-            return "Google Slides Presentation"
-        else:
-            parsed = urlparse(url)
-            domain = parsed.netloc.replace("www.", "")
-            if 'canva.com' in domain:
-                return "Canva Presentation"
-            elif 'slideshare.net' in domain:
-                return "SlideShare Presentation"
-            elif 'speakerdeck.com' in domain:
-                return "SpeakerDeck Presentation"
-            return f"Presentation from {domain}"
-    except:
-        return "Untitled Presentation"
-
-def load_slides():
-    """Load slides from JSON file"""
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def import_legacy_slides(conn):
+    """Copy slides from data/slides.json, giving duplicate or invalid ids fresh ones"""
+    legacy_slides = json_loads(LEGACY_JSON_FILE.read_bytes())
+    if not isinstance(legacy_slides, list):
+        raise TypeError(f"expected a list of slides, got {type(legacy_slides).__name__}")
+    seen_ids = set()
+    rows = []
+    for slide in legacy_slides:
+        if not isinstance(slide, dict) or not isinstance(slide.get('url'), str):
+            logger.warning("Skipping legacy slide without a URL: %r", slide)
+            continue
+        slide_id = legacy_slide_id(slide.get('id'))
+        # Old uploads reused len(slides) + 1 as id; let SQLite assign a new one
+        if slide_id in seen_ids:
+            slide_id = None
+        seen_ids.add(slide_id)
+        row = slide_to_row({**slide, 'id': slide_id})
+        # Nested JSON values cannot be bound as SQL parameters; store their text
+        rows.append(tuple(
+            v if v is None or isinstance(v, (str, int, float)) else str(v) for v in row
+        ))
+    conn.executemany(INSERT_SLIDE_SQL, rows)
+
+def rebuild_slides_table(conn):
+    """Copy the slides table into one with AUTOINCREMENT ids, in a single transaction"""
+    columns = ', '.join(SLIDE_COLUMNS)
+    conn.execute("SAVEPOINT rebuild_slides")
     try:
-        if DB_FILE.exists():
-            with open(DB_FILE, 'r') as f:
-                st.session_state.slides = json.load(f)
-                # Update file modification time
-                st.session_state.file_last_modified = os.path.getmtime(DB_FILE)
-                st.session_state.last_refresh = datetime.now()
-    except Exception as e:
-        st.session_state.slides = []
+        conn.execute("DROP TABLE IF EXISTS slides_new")
+        conn.execute(CREATE_SLIDES_TABLE_SQL.format(table="slides_new"))
+        conn.execute(f"INSERT INTO slides_new ({columns}) SELECT {columns} FROM slides")
+        conn.execute("DROP TABLE slides")
+        conn.execute("ALTER TABLE slides_new RENAME TO slides")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK TO rebuild_slides")
+        raise
+    finally:
+        conn.execute("RELEASE rebuild_slides")
 
-def save_slides():
-    """Save slides to JSON file with timestamp update"""
+@st.cache_resource
+def init_db():
+    """Create the slides table and import legacy JSON slides on first run"""
+    DATA_DIR.mkdir(exist_ok=True)
+    with closing(connect_db()) as conn, conn:
+        conn.execute(CREATE_SLIDES_TABLE_SQL.format(table="slides"))
+        # Add columns introduced after the table was first created
+        existing = {row['name'] for row in conn.execute("PRAGMA table_info(slides)")}
+        for column in SLIDE_COLUMNS:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE slides ADD COLUMN {column} TEXT")
+        # Rebuild tables created before ids were AUTOINCREMENT
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'slides'"
+        ).fetchone()[0]
+        if "AUTOINCREMENT" not in table_sql.upper():
+            rebuild_slides_table(conn)
+        # Import legacy JSON slides only once, so deleting every slide sticks
+        if conn.execute("PRAGMA user_version").fetchone()[0] < LEGACY_IMPORTED_VERSION:
+            is_empty = conn.execute("SELECT COUNT(*) FROM slides").fetchone()[0] == 0
+            # A savepoint keeps a failed import from leaving some of its rows behind
+            conn.execute("SAVEPOINT legacy_import")
+            try:
+                if is_empty and LEGACY_JSON_FILE.exists():
+                    import_legacy_slides(conn)
+                conn.execute(f"PRAGMA user_version = {LEGACY_IMPORTED_VERSION}")
+            except (ValueError, TypeError, AttributeError, OSError, sqlite3.Error) as e:
+                conn.execute("ROLLBACK TO legacy_import")
+                logger.warning("Could not import legacy slides from %s: %s", LEGACY_JSON_FILE, e)
+            finally:
+                conn.execute("RELEASE legacy_import")
+        # Refresh embed fields that are missing or were built by older, unescaped templates
+        rows = conn.execute(
+            "SELECT id, type, url, presentation_id, embed_url, embed_code FROM slides"
+        ).fetchall()
+        conn.executemany(
+            "UPDATE slides SET embed_url = ?, embed_code = ? WHERE id = ?",
+            [
+                (*fields, row['id'])
+                for row in rows
+                if (fields := get_embed_fields(row['type'], row['url'], row['presentation_id']))
+                != (row['embed_url'], row['embed_code'])
+            ]
+        )
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _load_slides_cached(version):
+    """Read all slides from the database, keyed by id; cached per database file version"""
+    with closing(connect_db()) as conn:
+        rows = conn.execute(f"SELECT {', '.join(SLIDE_COLUMNS)} FROM slides ORDER BY id")
+        return {row['id']: dict(row) for row in rows}
+
+def get_db_version():
+    """Return the database file's (mtime_ns, size, change counter), or None if it does not exist yet"""
     try:
-        # Mark that we're saving (for preventing self-triggered reloads)
-        st.session_state.saving = True
-        
-        with open(DB_FILE, 'w') as f:
-            json.dump(st.session_state.slides, f, indent=2)
-        
-        # Update file modification time
-        st.session_state.file_last_modified = os.path.getmtime(DB_FILE)
+        fd = os.open(DB_FILE, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        stat = os.fstat(fd)
+        # SQLite bumps the header's file change counter (offset 24) on every
+        # commit, which tells apart writes within one coarse mtime tick
+        change_counter = int.from_bytes(os.pread(fd, 4, 24), "big")
+    finally:
+        os.close(fd)
+    return stat.st_mtime_ns, stat.st_size, change_counter
+
+def load_slides(version):
+    """Load slides from the database, given its current file version"""
+    try:
+        # Slides in memory are already current if the file is unchanged
+        if version is not None and version != st.session_state.file_last_modified:
+            st.session_state.slides = _load_slides_cached(version)
+            st.session_state.slide_stats = None
+            # Update file version
+            st.session_state.file_last_modified = version
+            st.session_state.last_refresh = datetime.now()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Could not load slides: %s", e)
+        st.session_state.slides = {}
+
+@contextmanager
+def locked_write():
+    """Yield a connection inside a write transaction, then resync this session with the file"""
+    with closing(connect_db()) as conn, conn:
+        # Take the write lock first so no other session can commit before we compare
+        conn.execute("BEGIN IMMEDIATE")
+        in_sync = get_db_version() == st.session_state.file_last_modified
+        # Callers only write the rows and columns this session changed, so a
+        # stale copy is never written back over another session's changes
+        yield conn
+    
+    if in_sync:
+        # Record our own write so check_for_updates does not treat it as external
+        st.session_state.file_last_modified = get_db_version()
         st.session_state.last_refresh = datetime.now()
-        
-        # Clear saving flag
-        time.sleep(0.1)  # Small delay to ensure file is written
-        st.session_state.saving = False
+    else:
+        # Another session wrote since our last load; reload so its changes show up
+        load_slides(get_db_version())
+
+def save_slides():
+    """Write pending slide changes to the database in one transaction"""
+    try:
+        slides_by_id = st.session_state.slides
+        with locked_write() as conn:
+            for slide_id, columns in st.session_state.dirty_slides.items():
+                slide = slides_by_id.get(slide_id)
+                if slide is None:
+                    conn.execute("DELETE FROM slides WHERE id = ?", (slide_id,))
+                elif columns:
+                    # Only the edited columns are written, so stale fields in this
+                    # session never overwrite newer ones, and a row deleted
+                    # elsewhere is not brought back
+                    columns = sorted(columns)
+                    conn.execute(
+                        f"UPDATE slides SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?",
+                        [slide[c] for c in columns] + [slide_id]
+                    )
         
         return True
-    except Exception as e:
+    except (OSError, sqlite3.Error) as e:
         st.error(f"Error saving slides: {e}")
         return False
 
+def insert_slide(slide):
+    """Insert a new slide with an id assigned by SQLite and return that id"""
+    with locked_write() as conn:
+        cursor = conn.execute(INSERT_SLIDE_SQL, slide_to_row(slide))
+    return cursor.lastrowid
+
+def mark_slide_dirty(slide_id, columns=()):
+    """Record the changed columns of a slide (none for a removed slide) for the next flush"""
+    st.session_state.dirty_slides.setdefault(slide_id, set()).update(columns)
+    st.session_state.slide_stats = None
+
+def flush_slides():
+    """Write slide changes to disk at most once per rerun, only if modified"""
+    if st.session_state.dirty_slides and save_slides():
+        st.session_state.dirty_slides = {}
+
+def get_slide_stats():
+    """Return slide counts by type, recomputed only after the slides change"""
+    if st.session_state.slide_stats is None:
+        st.session_state.slide_stats = Counter(s['type'] for s in st.session_state.slides.values())
+    return st.session_state.slide_stats
+
+@lru_cache(maxsize=1024)
 def get_embed_url(presentation_id):
     """Generate embed URL for Google Slides"""
     return f"https://docs.google.com/presentation/d/{presentation_id}/embed"
 
-def check_for_updates():
+@lru_cache(maxsize=1024)
+def get_thumbnail_url(presentation_id):
+    """Generate a thumbnail image URL for a Google Slides deck (shared decks only)"""
+    return f"https://drive.google.com/thumbnail?id={presentation_id}&sz=w640"
+
+def get_embed_fields(slide_type, url, presentation_id):
+    """Return the (embed_url, embed_code) pair stored on a slide"""
+    if slide_type == 'google':
+        return get_embed_url(presentation_id or extract_google_slides_id(url)), None
+    if is_embeddable_url(url):
+        return None, get_embed_code(url)
+    return None, None
+
+def check_for_updates(current_version):
     """Check if the slides file has been modified by another user/instance"""
     try:
-        if DB_FILE.exists():
-            current_mod_time = os.path.getmtime(DB_FILE)
-            
+        if current_version is not None:
             # If file was modified by another instance (not by us)
-            if (current_mod_time > st.session_state.file_last_modified and 
-                not st.session_state.get('saving', False)):
+            if current_version != st.session_state.file_last_modified:
                 
                 # Load the updated slides
-                with open(DB_FILE, 'r') as f:
-                    updated_slides = json.load(f)
+                updated_slides = _load_slides_cached(current_version)
                 
                 # Only update if slides are different
+                now = datetime.now()
                 if updated_slides != st.session_state.slides:
                     st.session_state.slides = updated_slides
-                    st.session_state.file_last_modified = current_mod_time
-                    st.session_state.last_refresh = datetime.now()
-                    st.session_state.last_checked = datetime.now()
+                    st.session_state.slide_stats = None
+                    st.session_state.file_last_modified = current_version
+                    st.session_state.last_refresh = now
+                    st.session_state.last_checked = now
                     return True
                 
-                st.session_state.file_last_modified = current_mod_time
-                st.session_state.last_checked = datetime.now()
+                st.session_state.file_last_modified = current_version
+                st.session_state.last_checked = now
         
         return False
-    except Exception as e:
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Could not check for slide updates: %s", e)
         return False
 
-def display_slide_in_dashboard(slide, index):
+def handle_slide_action(slide_id, action_key):
+    """Apply the action picked in a slide's action selector, then reset it"""
+    action = st.session_state[action_key]
+    st.session_state[action_key] = SLIDE_ACTIONS[0]
+    
+    if action == "✏️ Edit":
+        st.session_state.edit_slide_id = slide_id
+    elif action == "🔄 Update":
+        slide = st.session_state.slides[slide_id]
+        slide['last_modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        mark_slide_dirty(slide['id'], ('last_modified',))
+        st.toast("Slide timestamp refreshed")
+    elif action == "🗑️ Delete":
+        st.session_state.delete_slide_id = slide_id
+
+@lru_cache(maxsize=1024)
+def render_slide_header(title, uploader, date, last_modified, slide_type, description):
+    """Render a slide's header, description and body opening as one HTML string"""
+    is_google = slide_type == 'google'
+    html = SLIDE_HEADER_TEMPLATE.format(
+        title=title,
+        uploader=uploader,
+        date=date,
+        last_modified=last_modified,
+        badge_background='#e8f4fd' if is_google else '#f0f0f0',
+        badge_color='#1a73e8' if is_google else '#666',
+        badge_label='Google Slides' if is_google else 'Web Link'
+    )
+    if description:
+        html += SLIDE_DESCRIPTION_TEMPLATE.format(description=description)
+    return html + SLIDE_BODY_OPEN_HTML
+
+@lru_cache(maxsize=1024)
+def render_slide_footer(url, slide_type, has_embed):
+    """Render the link footer shown under a slide's preview"""
+    if slide_type == 'google':
+        html = OPEN_LINK_TEMPLATE.format(url=url, label="Open in Google Slides")
+    elif has_embed:
+        html = OPEN_LINK_TEMPLATE.format(url=url, label="Open Original")
+    else:
+        html = EXTERNAL_LINK_TEMPLATE.format(
+            url=url,
+            url_preview=url[:80] + ('...' if len(url) > 80 else '')
+        )
+    return html + "</div>"
+
+def display_slide_in_dashboard(slide):
     """Display a slide directly in the dashboard"""
     with st.container():
-        st.markdown(f"""
-        <div style="
-            background: #ffffff;
-            border-radius: 8px 8px 0 0;
-            padding: 20px;
-            margin: 15px 0 0 0;
-            border: 1px solid #e0e0e0;
-            border-bottom: none;
-        ">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <h3 style="margin: 0 0 8px 0; color: #2c3e50; font-size: 1.4rem; font-weight: 600;">
-                        📊 {slide['title']}
-                    </h3>
-                    <div style="display: flex; align-items: center; gap: 15px; color: #666; font-size: 0.9em;">
-                        <span style="display: flex; align-items: center; gap: 5px;">
-                            👤 {slide['uploader']}
-                        </span>
-                        <span>•</span>
-                        <span>{slide['date']}</span>
-                        <span>•</span>
-                        <span title="Last modified" style="color: #888;">
-                            📝 {slide.get('last_modified', slide['date'])}
-                        </span>
-                    </div>
-                </div>
-                <div style="
-                    background: {'#e8f4fd' if slide['type'] == 'google' else '#f0f0f0'};
-                    color: {'#1a73e8' if slide['type'] == 'google' else '#666'};
-                    padding: 6px 12px;
-                    border-radius: 15px;
-                    font-size: 0.9em;
-                    font-weight: 500;
-                ">
-                    {'Google Slides' if slide['type'] == 'google' else 'Web Link'}
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        if slide.get('description'):
-            st.markdown(f"""
-            <div style="
-                background: #f8f9fa;
-                padding: 15px 20px;
-                border-left: 3px solid #1a73e8;
-                margin: 0;
-                border-right: 1px solid #e0e0e0;
-                border-bottom: 1px solid #e0e0e0;
-            ">
-                <p style="margin: 0; color: #555; font-size: 1em; line-height: 1.5;">{slide['description']}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="
-            background: #ffffff;
-            padding: 0;
-            border: 1px solid #e0e0e0;
-            border-top: none;
-            border-radius: 0 0 8px 8px;
-        ">
-        """, unsafe_allow_html=True)
+        header_html = render_slide_header(
+            slide['title'],
+            slide['uploader'],
+            slide['date'],
+            slide.get('last_modified') or slide['date'],
+            slide['type'],
+            slide.get('description')
+        )
         
-        if slide['type'] == 'google':
-            presentation_id = extract_google_slides_id(slide['url'])
-            embed_url = get_embed_url(presentation_id)
-            
-            iframe_html = f'''
-            <iframe 
-                src="{embed_url}" 
-                width="100%" 
-                height="450" 
-                frameborder="0" 
-                allowfullscreen="true" 
-                mozallowfullscreen="true" 
-                webkitallowfullscreen="true"
-                style="border-radius: 0;">
-            </iframe>
-            '''
-            st.components.v1.html(iframe_html, height=470)
-            
-            st.markdown(f"""
-            <div style="
-                padding: 15px;
-                background: #f8f9fa;
-                border-top: 1px solid #e0e0e0;
-                text-align: center;
-            ">
-                <a href="{slide['url']}" target="_blank" style="
-                    text-decoration: none;
-                    color: #1a73e8;
-                    font-size: 0.95em;
-                    padding: 8px 20px;
-                    border: 1px solid #1a73e8;
-                    border-radius: 4px;
-                    display: inline-flex;
-                    align-items: center;
-                    gap: 8px;
-                    background: white;
-                ">
-                    🔗 Open in Google Slides
-                </a>
-            </div>
-            """, unsafe_allow_html=True)
+        # Slides without stored embed fields fall back to computing them
+        embed_url, embed_code = slide.get('embed_url'), slide.get('embed_code')
+        if not (embed_url or embed_code):
+            embed_url, embed_code = get_embed_fields(slide['type'], slide['url'], slide.get('presentation_id'))
+        footer_html = render_slide_footer(slide['url'], slide['type'], bool(embed_url or embed_code))
         
-        else:
-            embed_code = get_embed_code(slide['url'])
-            
-            if embed_code and is_embeddable_url(slide['url']):
-                st.components.v1.html(embed_code, height=520)
-                st.markdown(f"""
-                <div style="
-                    padding: 15px;
-                    background: #f8f9fa;
-                    border-top: 1px solid #e0e0e0;
-                    text-align: center;
-                ">
-                    <a href="{slide['url']}" target="_blank" style="
-                        text-decoration: none;
-                        color: #1a73e8;
-                        font-size: 0.95em;
-                        padding: 8px 20px;
-                        border: 1px solid #1a73e8;
-                        border-radius: 4px;
-                        display: inline-flex;
-                        align-items: center;
-                        gap: 8px;
-                        background: white;
-                    ">
-                        🔗 Open Original
-                    </a>
-                </div>
-                """, unsafe_allow_html=True)
+        if embed_url or embed_code:
+            st.markdown(header_html, unsafe_allow_html=True)
+            if embed_url:
+                iframe_html = GOOGLE_IFRAME_TEMPLATE.format(embed_url=escape(embed_url, quote=True))
+                thumbnail_url = get_thumbnail_url(
+                    slide.get('presentation_id') or extract_google_slides_id(slide['url'])
+                )
+                st.components.v1.html(wrap_click_to_load(iframe_html, slide['title'], thumbnail_url), height=470)
             else:
-                st.markdown(f"""
-                <div style="
-                    padding: 40px 20px;
-                    background: #f8f9fa;
-                    text-align: center;
-                ">
-                    <div style="font-size: 3rem; margin-bottom: 15px; color: #666;">🔗</div>
-                    <h4 style="color: #2c3e50; margin-bottom: 10px;">External Presentation</h4>
-                    <p style="color: #666; margin-bottom: 20px; font-size: 0.95em;">
-                        {slide['url'][:80]}{'...' if len(slide['url']) > 80 else ''}
-                    </p>
-                    <a href="{slide['url']}" target="_blank" style="
-                        text-decoration: none;
-                        background: #1a73e8;
-                        color: white;
-                        padding: 10px 25px;
-                        border-radius: 4px;
-                        font-weight: 500;
-                        display: inline-block;
-                    ">
-                        Open Presentation
-                    </a>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button(f"✏️ Edit", key=f"edit_{index}_{slide['id']}", use_container_width=True):
-                st.session_state.edit_slide_id = index
-                st.rerun()
-        
-        with col2:
-            if st.button(f"🔄 Update", key=f"update_{index}_{slide['id']}", use_container_width=True):
-                st.session_state.slides[index]['last_modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                save_slides()
-                st.success("Slide updated!")
-                time.sleep(0.5)
-                st.rerun()
+                st.components.v1.html(wrap_click_to_load(embed_code, slide['title']), height=520)
+            st.markdown(footer_html, unsafe_allow_html=True)
+        else:
+            # Nothing to embed, so the whole card is a single markdown element
+            st.markdown(header_html + footer_html, unsafe_allow_html=True)
         
-        with col3:
-            if st.button(f"🗑️ Delete", key=f"delete_{index}_{slide['id']}", type="secondary", use_container_width=True):
-                st.session_state.delete_slide_id = index
-                st.rerun()
+        action_key = f"action_{slide['id']}"
+        st.radio(
+            "Slide action",
+            SLIDE_ACTIONS,
+            horizontal=True,
+            label_visibility="collapsed",
+            key=action_key,
+            on_change=handle_slide_action,
+            args=(slide['id'], action_key)
+        )
         
         st.markdown("<br>", unsafe_allow_html=True)
 
-def display_edit_form(slide, index):
+def display_edit_form(slide):
     """Display edit form"""
     st.markdown(f"## ✏️ Edit Slide: {slide['title']}")
     
@@ -410,20 +757,23 @@ def display_edit_form(slide, index):
             st.session_state.edit_slide_id = None
             st.rerun()
     
-    with st.form(key=f"edit_form_{index}_{slide['id']}"):
+    with st.form(key=f"edit_form_{slide['id']}"):
         new_title = st.text_input("Title", value=slide['title'])
-        new_description = st.text_area("Description", value=slide.get('description', ''), height=100)
+        new_description = st.text_area("Description", value=slide.get('description') or '', height=100)
         
         col1, col2 = st.columns(2)
         
         with col1:
             if st.form_submit_button("💾 Save Changes", use_container_width=True):
-                st.session_state.slides[index]['title'] = new_title
-                st.session_state.slides[index]['description'] = new_description
-                st.session_state.slides[index]['last_modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                save_slides()
-                st.success("Slide updated successfully!")
-                time.sleep(0.5)
+                # Only touch the database if a field actually changed
+                if new_title != slide['title'] or new_description != (slide.get('description') or ''):
+                    st.session_state.slides[slide['id']].update({
+                        'title': new_title,
+                        'description': new_description,
+                        'last_modified': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    })
+                    mark_slide_dirty(slide['id'], ('title', 'description', 'last_modified'))
+                st.toast("Slide updated successfully!")
                 st.session_state.edit_slide_id = None
                 st.rerun()
         
@@ -432,7 +782,7 @@ def display_edit_form(slide, index):
                 st.session_state.edit_slide_id = None
                 st.rerun()
 
-def display_delete_confirmation(slide, index):
+def display_delete_confirmation(slide):
     """Display delete confirmation"""
     st.markdown(f"## 🗑️ Delete Slide")
     
@@ -442,33 +792,15 @@ def display_delete_confirmation(slide, index):
             st.session_state.delete_slide_id = None
             st.rerun()
     
-    st.markdown(f"""
-    <div style="
-        background: #fff8e1;
-        border: 1px solid #ffecb3;
-        border-radius: 8px;
-        padding: 25px;
-        text-align: center;
-        margin: 20px 0;
-    ">
-        <div style="font-size: 2.5rem; margin-bottom: 15px;">⚠️</div>
-        <h3 style="color: #ff6f00; margin-bottom: 15px;">
-            Delete "{slide['title']}"?
-        </h3>
-        <p style="color: #666;">
-            This action cannot be undone. The slide will be permanently removed.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(DELETE_CONFIRM_TEMPLATE.format(title=slide['title']), unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
     
     with col1:
         if st.button("✅ Yes, Delete", type="primary", use_container_width=True):
-            st.session_state.slides.pop(index)
-            save_slides()
-            st.success(f"'{slide['title']}' deleted successfully!")
-            time.sleep(0.5)
+            del st.session_state.slides[slide['id']]
+            mark_slide_dirty(slide['id'])
+            st.toast(f"'{slide['title']}' deleted successfully!")
             st.session_state.delete_slide_id = None
             st.rerun()
     
@@ -489,23 +821,36 @@ def handle_upload(upload_option, url, title, description, uploader):
     else:
         presentation_id = url
         slide_type = 'link'
+    embed_url, embed_code = get_embed_fields(slide_type, url, presentation_id)
     
     final_title = title if title else extract_title_from_url(url)
+    now = datetime.now()
     
     new_slide = {
-        'id': len(st.session_state.slides) + 1,
+        'id': None,
         'title': final_title,
         'url': url,
         'presentation_id': presentation_id,
         'type': slide_type,
         'uploader': uploader or "Anonymous",
-        'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
+        'date': now.strftime("%Y-%m-%d %H:%M"),
         'description': description,
-        'last_modified': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        'last_modified': now.strftime("%Y-%m-%d %H:%M:%S"),
+        'embed_url': embed_url,
+        'embed_code': embed_code
     }
     
-    st.session_state.slides.append(new_slide)
-    save_slides()
+    # Write pending edits first so a reload after the insert cannot drop them
+    flush_slides()
+    try:
+        # A NULL id lets SQLite pick one no other session can have taken
+        new_slide['id'] = insert_slide(new_slide)
+    except (OSError, sqlite3.Error) as e:
+        st.error(f"Error saving slide: {e}")
+        return False
+    
+    st.session_state.slides[new_slide['id']] = new_slide
+    st.session_state.slide_stats = None
     
     # Reset form data
     st.session_state.upload_form_data = {
@@ -517,9 +862,44 @@ def handle_upload(upload_option, url, title, description, uploader):
     
     return True
 
+def display_pagination(total_slides):
+    """Display page navigation and return the slice bounds of the current page"""
+    total_pages = max(1, -(-total_slides // PAGE_SIZE))
+    st.session_state.page = min(st.session_state.page, total_pages - 1)
+    
+    if total_pages > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        
+        with col1:
+            if st.button("← Previous", disabled=st.session_state.page == 0, use_container_width=True, key="prev_page_btn"):
+                st.session_state.page -= 1
+                st.rerun()
+        
+        with col2:
+            st.markdown(PAGE_INDICATOR_TEMPLATE.format(
+                page=st.session_state.page + 1,
+                total_pages=total_pages
+            ), unsafe_allow_html=True)
+        
+        with col3:
+            if st.button("Next →", disabled=st.session_state.page >= total_pages - 1, use_container_width=True, key="next_page_btn"):
+                st.session_state.page += 1
+                st.rerun()
+    
+    start = st.session_state.page * PAGE_SIZE
+    return start, start + PAGE_SIZE
+
 def main():
-    # Load existing slides
-    load_slides()
+    init_db()
+    
+    # Persist pending changes from the previous run before reloading
+    flush_slides()
+    
+    # Load existing slides on first run; later changes from other users
+    # arrive through check_for_updates
+    db_version = get_db_version()
+    if not st.session_state.slides:
+        load_slides(db_version)
     
     # Sidebar for upload
     with st.sidebar:
@@ -635,7 +1015,7 @@ def main():
                         'description': description,
                         'uploader': uploader
                     }
-                    st.success(f"'{title if title else extract_title_from_url(url)}' uploaded successfully!")
+                    st.toast(f"'{title if title else extract_title_from_url(url)}' uploaded successfully!")
                     st.balloons()
                     # Reset form data for next use
                     st.session_state.upload_form = {
@@ -644,8 +1024,6 @@ def main():
                         'description': '',
                         'uploader': ''
                     }
-                    # Clear submission flag after delay
-                    time.sleep(0.5)
                     st.session_state.form_submitted = False
                     st.rerun()
             
@@ -686,14 +1064,23 @@ def main():
                 st.session_state.refresh_interval = refresh_interval
                 st.rerun()
         
+        # Eager embed toggle
+        auto_embed = st.checkbox(
+            "Auto-load previews",
+            value=st.session_state.auto_embed,
+            help="Load every slide preview on page load instead of on click"
+        )
+        
+        if auto_embed != st.session_state.auto_embed:
+            st.session_state.auto_embed = auto_embed
+            st.rerun()
+        
         # Manual refresh button
         if st.button("🔄 Check for Updates Now", use_container_width=True, key="check_updates_btn"):
-            if check_for_updates():
-                st.success("Slides updated!")
-            else:
-                st.info("No new updates found.")
-            time.sleep(1)
-            st.rerun()
+            if check_for_updates(db_version):
+                st.toast("Slides updated!")
+                st.rerun()
+            st.toast("No new updates found.")
         
         # Last checked time
         if st.session_state.get('last_checked'):
@@ -772,36 +1159,42 @@ def main():
     
     # Show edit form if editing
     if st.session_state.edit_slide_id is not None:
-        slide = st.session_state.slides[st.session_state.edit_slide_id]
-        display_edit_form(slide, st.session_state.edit_slide_id)
-        return
+        slide = st.session_state.slides.get(st.session_state.edit_slide_id)
+        if slide is not None:
+            display_edit_form(slide)
+            return
+        # The slide was removed in the meantime
+        st.session_state.edit_slide_id = None
     
     # Show delete confirmation if deleting
     if st.session_state.delete_slide_id is not None:
-        slide = st.session_state.slides[st.session_state.delete_slide_id]
-        display_delete_confirmation(slide, st.session_state.delete_slide_id)
-        return
+        slide = st.session_state.slides.get(st.session_state.delete_slide_id)
+        if slide is not None:
+            display_delete_confirmation(slide)
+            return
+        # The slide was removed in the meantime
+        st.session_state.delete_slide_id = None
+    
+    # Refresh settings are read once; the sidebar has already applied any changes
+    auto_refresh = st.session_state.auto_refresh
+    refresh_interval = st.session_state.refresh_interval
     
     # Auto-refresh logic - ONLY if we're not in the middle of a form submission
-    if st.session_state.auto_refresh and not st.session_state.get('form_submitted', False):
-        current_time = datetime.now()
-        time_since_last_check = (current_time - st.session_state.last_checked).total_seconds()
+    if auto_refresh and not st.session_state.get('form_submitted', False):
+        # The browser-side timer reruns the script every interval without blocking it
+        st_autorefresh(interval=refresh_interval * 1000, key="slides_autorefresh")
         
-        if time_since_last_check >= st.session_state.refresh_interval:
-            if check_for_updates():
-                # Show a subtle notification that updates were loaded
-                update_container = st.empty()
-                with update_container:
-                    st.info(f"🔄 Auto-refresh: Loaded updates at {current_time.strftime('%H:%M:%S')}")
-                    time.sleep(1.5)
-                update_container.empty()
-            else:
-                st.session_state.last_checked = current_time
+        current_time = datetime.now()
+        if check_for_updates(db_version):
+            # Show a subtle notification that updates were loaded
+            st.toast(f"🔄 Auto-refresh: Loaded updates at {current_time.strftime('%H:%M:%S')}")
+        st.session_state.last_checked = current_time
     
     # Dashboard stats and refresh status
+    counts = get_slide_stats()
     total_slides = len(st.session_state.slides)
-    google_slides = len([s for s in st.session_state.slides if s['type'] == 'google'])
-    web_links = len([s for s in st.session_state.slides if s['type'] == 'link'])
+    google_slides = counts['google']
+    web_links = counts['link']
     
     # Refresh status header
     col_header1, col_header2 = st.columns([3, 1])
@@ -811,81 +1204,36 @@ def main():
     
     with col_header2:
         refresh_status = ""
-        if st.session_state.auto_refresh:
-            refresh_status = f"🔄 Auto-refresh: Every {st.session_state.refresh_interval}s"
+        if auto_refresh:
+            refresh_status = f"🔄 Auto-refresh: Every {refresh_interval}s"
         else:
             refresh_status = "⏸️ Auto-refresh: Off"
         
-        st.markdown(f"""
-        <div style="text-align: right; margin-bottom: 10px;">
-            <span class="refresh-status">{refresh_status}</span>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(REFRESH_STATUS_TEMPLATE.format(refresh_status=refresh_status), unsafe_allow_html=True)
     
     # Stats cards
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown(f"""
-        <div style="
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            border: 1px solid #e0e0e0;
-            text-align: center;
-        ">
-            <div style="font-size: 1.8rem; margin-bottom: 10px; color: #2c3e50;">📊</div>
-            <div style="font-size: 1.8rem; font-weight: bold; color: #2c3e50;">{total_slides}</div>
-            <div style="color: #666; font-size: 0.9em; margin-top: 5px;">Total Slides</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric(label="📊 Total Slides", value=total_slides)
     
     with col2:
-        st.markdown(f"""
-        <div style="
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            border: 1px solid #e0e0e0;
-            text-align: center;
-        ">
-            <div style="font-size: 1.8rem; margin-bottom: 10px; color: #2c3e50;">🌐</div>
-            <div style="font-size: 1.8rem; font-weight: bold; color: #2c3e50;">{google_slides}</div>
-            <div style="color: #666; font-size: 0.9em; margin-top: 5px;">Google Slides</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric(label="🌐 Google Slides", value=google_slides)
     
     with col3:
-        st.markdown(f"""
-        <div style="
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            border: 1px solid #e0e0e0;
-            text-align: center;
-        ">
-            <div style="font-size: 1.8rem; margin-bottom: 10px; color: #2c3e50;">🔗</div>
-            <div style="font-size: 1.8rem; font-weight: bold; color: #2c3e50;">{web_links}</div>
-            <div style="color: #666; font-size: 0.9em; margin-top: 5px;">Web Links</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric(label="🔗 Web Links", value=web_links)
     
     with col4:
         if st.button("🔄 Force Refresh", use_container_width=True, key="force_refresh_main"):
-            if check_for_updates():
-                st.success("Slides refreshed!")
-            else:
-                st.info("No updates found.")
-            time.sleep(1)
-            st.rerun()
+            if check_for_updates(db_version):
+                st.toast("Slides refreshed!")
+                st.rerun()
+            st.toast("No updates found.")
     
     # Last updated info
-    if DB_FILE.exists():
-        try:
-            mod_time = datetime.fromtimestamp(os.path.getmtime(DB_FILE))
-            st.caption(f"📝 Last database update: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        except:
-            pass
+    if db_version is not None:
+        mod_time = datetime.fromtimestamp(db_version[0] / 1e9)
+        st.caption(f"📝 Last database update: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -908,31 +1256,14 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # Auto-refresh placeholder if no slides
-        if st.session_state.auto_refresh and not st.session_state.get('form_submitted', False):
-            time.sleep(st.session_state.refresh_interval)
-            st.rerun()
-        
         return
     
-    # Display all slides
-    for i, slide in enumerate(st.session_state.slides):
-        display_slide_in_dashboard(slide, i)
+    # Display the current page of slides
+    start, end = display_pagination(total_slides)
+    for slide in islice(st.session_state.slides.values(), start, end):
+        display_slide_in_dashboard(slide)
     
-    # Final auto-refresh trigger at the end - ONLY if not in form submission
-    if st.session_state.auto_refresh and not st.session_state.get('form_submitted', False):
-        current_time = datetime.now()
-        time_since_last_check = (current_time - st.session_state.last_checked).total_seconds()
-        
-        if time_since_last_check >= st.session_state.refresh_interval:
-            # Create a placeholder for the next refresh
-            refresh_placeholder = st.empty()
-            with refresh_placeholder:
-                st.caption(f"🔄 Next auto-refresh in {st.session_state.refresh_interval - time_since_last_check:.0f}s")
-            
-            # Small delay before checking again
-            time.sleep(0.1)
-            st.rerun()
+    flush_slides()
 
 if __name__ == "__main__":
     main()